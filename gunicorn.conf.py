@@ -0,0 +1,17 @@
+# gunicorn.conf.py
+
+# Configuration for serving the pipeline outside AWS Lambda (e.g. a container
+# or VM deployment), where the single-threaded Werkzeug dev server would
+# serialize concurrent requests behind each minute-long pipeline run.
+#
+# The workload is I/O-bound — each request spends most of its wall-clock
+# waiting on LLM responses — so a few processes with many threads serve dozens
+# of concurrent pipelines per core. Threaded workers are used rather than
+# gevent because the pipeline drives per-request asyncio event loops, which do
+# not mix with gevent's monkey-patching.
+
+wsgi_app = "pipeline_server:app"
+bind = "0.0.0.0:5000"
+workers = 2
+threads = 16
+timeout = 300
@@ -4,18 +4,23 @@
 # generation pipeline. It defines the Flask web server, manages service
 # instantiation, and controls the flow of data through the multi-step process.
 
+import asyncio
+import concurrent.futures
+import json
 import uuid
 import flask
 import logging
-from typing import Dict, List
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List
 
 # --- Core Application Imports ---
 # In this public version of the repository, the implementation details of the
 # LLM-based services have been abstracted away to protect intellectual property.
 # The class structures are preserved to demonstrate the overall architecture.
 from src.utils.config_loader import load_config
-from src.utils.llm_handler import LlmApiHandler
+from src.utils.background_loop import run_coroutine
+from src.utils.checkpoint import Checkpoint
+from src.utils.llm_handler import LlmApiHandler, get_cached_handler
+from src.utils.summary_cache import SummaryCache
 from src.services.id_mapping_service import IdMappingService
 from src.services.chunker_service import ChunkerService
 from src.services.llm_summarizer_service import LlmSummarizerService
@@ -24,7 +29,7 @@ from src.services.llm_concept_block_matcher_service import LlmConceptBlockMatche
 from src.services.llm_verbatim_script_extractor_service import LlmVerbatimScriptExtractorService
 from src.services.offline_indexer_service import OfflineIndexerService
 from src.services.llm_verbatim_indexer_service import LlmVerbatimIndexerService
-from src.services.llm_script_evaluator_service import LlmScriptEvaluatorService
+from src.services.llm_critic_service import LlmCriticService
 from src.services.output_formatter_service import OutputFormatterService
 
 # --- App and Logging Initialization ---
@@ -49,56 +54,171 @@ matcher_service = LlmConceptBlockMatcherService()
 script_extractor_service = LlmVerbatimScriptExtractorService()
 offline_indexer_service = OfflineIndexerService()
 llm_indexer_service = LlmVerbatimIndexerService()
-evaluator_service = LlmScriptEvaluatorService()
+critic_service = LlmCriticService()
 output_formatter_service = OutputFormatterService()
 
+# Cache of long-form summaries keyed by transcript content and model, so
+# repeat runs over the same transcript skip the summarizer LLM call.
+summary_cache = SummaryCache()
 
-def process_single_concept(
+# Completed critiques keyed by (summary, title_id); lets a rerun after a
+# partial failure reload finished concepts instead of re-paying their LLM
+# calls. Disabled unless PIPELINE_CHECKPOINT_DIR is set.
+checkpoint_store = Checkpoint()
+
+
+# The evaluation wave is I/O-bound (one LLM round trip per script), so its
+# concurrency is bounded per event loop rather than by a thread count.
+MAX_CONCURRENT_EVALUATIONS = 20
+
+# Upper bound on a single concept's evaluation, including retries inside the
+# provider SDK. A stuck call degrades to an error concept instead of stalling
+# the remaining results behind it.
+EVALUATION_TIMEOUT_SECONDS = 120
+
+
+async def evaluate_single_concept(
     concept: Dict,
-    blocks_data: List[Dict],
     long_form_summary: str,
     handlers: Dict[str, LlmApiHandler],
     request_id: str
 ) -> Dict:
     """
-    Worker function to process one concept through the parallel part of the pipeline.
-
-    This function is executed by the ThreadPoolExecutor for each generated concept,
-    allowing multiple concepts to be scripted and evaluated simultaneously.
+    Coroutine that critiques one concept's final script: a single combined
+    call returns both the evaluation and the recommendations, so this is the
+    only per-concept LLM round trip. All concepts are awaited concurrently on
+    a single event loop, sharing the pooled async HTTP client.
     """
     title_id = concept.get('title_id', 'unknown_concept')
     log_prefix = f"[{request_id}][{title_id}]"
-    app.logger.info(f"{log_prefix} Starting parallel processing for concept.")
 
     try:
-        # Step 5a: Match concept to relevant transcript blocks.
-        matched_concept = matcher_service.run([concept], blocks_data, handlers['concept_block_matcher'])[0]
-        # Step 5b: Extract a verbatim script from the matched blocks.
-        scripted_concept = script_extractor_service.run([matched_concept], blocks_data, handlers['verbatim_script_extractor'])[0]
-        # Step 5c: Perform a fast, offline search to find word indices for the script.
-        indexed_concept = offline_indexer_service.run([scripted_concept], blocks_data)[0]
-        
-        # Step 5d: For any failed chunks, use a powerful LLM-based fallback indexer.
-        if any('start_word_index' not in chunk for chunk in indexed_concept.get('script_chunks', [])):
-            indexed_concept = llm_indexer_service.run([indexed_concept], blocks_data, handlers['verbatim_indexer'])[0]
-
-        # Step 5e: Evaluate the final script against a proprietary rubric.
-        script_text = indexed_concept.get('script', '')
+        script_text = concept.get('script', '')
         if script_text:
-            evaluation = evaluator_service.run(script_text, long_form_summary, handlers['script_evaluator'])
-            indexed_concept['evaluation'] = evaluation if evaluation else None
+            checkpoint_key = Checkpoint.make_key('critique', long_form_summary, title_id)
+            critique = checkpoint_store.get(checkpoint_key)
+            if critique is None:
+                critique = await critic_service.arun(script_text, long_form_summary, concept, handlers['script_evaluator'])
+                if critique:
+                    checkpoint_store.set(checkpoint_key, critique)
+            # Split the combined critique into the existing client-facing keys.
+            concept['evaluation'] = critique.get('evaluation') if critique else None
+            concept['recommendations'] = critique.get('recommendations') if critique else None
 
-        indexed_concept['status'] = 'success'
+        concept['status'] = 'success'
         app.logger.info(f"{log_prefix} Successfully processed concept.")
-        return indexed_concept
+        return concept
 
     except Exception as e:
-        app.logger.error(f"{log_prefix} Error processing concept: {e}", exc_info=True)
+        app.logger.error(f"{log_prefix} Error evaluating concept: {e}", exc_info=True)
         concept['status'] = 'error'
         concept['error_message'] = str(e)
         return concept
 
 
+def evaluate_concepts_batch(
+    concepts: List[Dict],
+    long_form_summary: str,
+    handlers: Dict[str, LlmApiHandler],
+    request_id: str
+) -> List[Dict]:
+    """
+    Critiques all concepts' scripts with one batched LLM call.
+
+    The critique feeds nothing further downstream, so it runs as a post-pass
+    once every concept has a script: a single round trip returns both the
+    evaluation and the recommendations for every script, with the shared
+    summary and rubric sent once.
+    """
+    to_evaluate = [c for c in concepts if c.get('script')]
+    try:
+        # Reload any critiques already checkpointed by an earlier (partially
+        # failed) run; only the remainder goes to the LLM.
+        pending = []
+        for concept in to_evaluate:
+            checkpoint_key = Checkpoint.make_key('critique', long_form_summary, concept.get('title_id', ''))
+            critique = checkpoint_store.get(checkpoint_key)
+            if critique is not None:
+                concept['evaluation'] = critique.get('evaluation')
+                concept['recommendations'] = critique.get('recommendations')
+            else:
+                pending.append(concept)
+        if len(pending) < len(to_evaluate):
+            app.logger.info(f"[{request_id}] Restored {len(to_evaluate) - len(pending)} critiques from checkpoints.")
+
+        if pending:
+            critiques = critic_service.run_batch(pending, long_form_summary, handlers['script_evaluator'])
+            for concept, critique in zip(pending, critiques):
+                # Split the combined critique into the existing client-facing keys.
+                concept['evaluation'] = critique.get('evaluation') if critique else None
+                concept['recommendations'] = critique.get('recommendations') if critique else None
+                if critique:
+                    checkpoint_store.set(
+                        Checkpoint.make_key('critique', long_form_summary, concept.get('title_id', '')), critique
+                    )
+
+        for concept in concepts:
+            concept['status'] = 'success'
+        app.logger.info(f"[{request_id}] Batched critique finished for {len(to_evaluate)} scripts.")
+
+    except Exception as e:
+        # The critique feeds nothing further downstream, so its failure must
+        # not discard the scripting work that is already paid for: concepts
+        # ship with whatever critiques were restored from checkpoints and
+        # None for the rest, rather than collapsing the whole response into
+        # error stubs with no scripts.
+        app.logger.error(
+            f"[{request_id}] Error in batched critique, returning scripts without evaluations: {e}",
+            exc_info=True
+        )
+        for concept in concepts:
+            concept.setdefault('evaluation', None)
+            concept.setdefault('recommendations', None)
+            concept['status'] = 'success'
+
+    return concepts
+
+
+def stream_concept_results(
+    concepts: List[Dict],
+    long_form_summary: str,
+    handlers: Dict[str, LlmApiHandler],
+    full_objects_transcript: Dict,
+    id_map: Dict,
+    request_id: str
+) -> Iterator[str]:
+    """
+    Generator yielding one NDJSON line per concept, in completion order.
+
+    Evaluations are scheduled on the shared background event loop, so this
+    synchronous generator only waits on thread-safe futures. The endpoint
+    delivers the first finished concept immediately instead of holding the
+    whole response until the slowest evaluation returns.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+
+    async def evaluate_with_limit(concept: Dict) -> Dict:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    evaluate_single_concept(concept, long_form_summary, handlers, request_id),
+                    timeout=EVALUATION_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                title_id = concept.get('title_id', 'unknown_concept')
+                app.logger.error(f"[{request_id}][{title_id}] Evaluation timed out after {EVALUATION_TIMEOUT_SECONDS}s.")
+                concept['status'] = 'error'
+                concept['error_message'] = f"Evaluation timed out after {EVALUATION_TIMEOUT_SECONDS} seconds."
+                return concept
+
+    futures = [run_coroutine(evaluate_with_limit(c)) for c in concepts]
+    for future in concurrent.futures.as_completed(futures):
+        concept = future.result()
+        formatted = output_formatter_service.run([concept], full_objects_transcript, id_map)[0]
+        yield json.dumps(formatted) + "\n"
+    app.logger.info(f"[{request_id}] Finished streaming all concepts.")
+
+
 @app.route('/generate-shorts', methods=['POST'])
 def generate_shorts():
     """
@@ -121,19 +241,35 @@ def generate_shorts():
         # --- Pipeline Stage 1: Pre-processing ---
         textual_transcript, full_objects_transcript, id_map = id_mapping_service.run(request_data['elementsData'])
         blocks_data = chunker_service.run(textual_transcript)
+        # block_id is the canonical join key for every downstream service, so
+        # the id -> block index is built once here and passed down rather than
+        # being rebuilt inside each service.
+        block_lookup = {b['block_id']: b for b in blocks_data}
 
         # --- Pipeline Stage 2: Dynamic Handler and Concept Generation ---
-        # Create LLM handlers dynamically based on per-request configurations,
-        # demonstrating a highly flexible, client-driven architecture.
+        # Resolve LLM handlers dynamically based on per-request configurations,
+        # demonstrating a highly flexible, client-driven architecture. Repeat
+        # requests with an identical merged config reuse the cached handler
+        # (and its pooled connections) instead of constructing new clients.
         global_llm_config = CONFIG.get('llm', {})
         service_configs = request_data.get('service_configurations', {})
         handlers = {
-            name: LlmApiHandler({**global_llm_config.get(s_conf['provider'], {}), **s_conf})
+            name: get_cached_handler({**global_llm_config.get(s_conf['provider'], {}), **s_conf})
             for name, s_conf in service_configs.items()
         }
         
-        full_transcript_text = "".join([w['text'] for w in textual_transcript.get("words", [])])
-        long_form_summary = summarizer_service.run(full_transcript_text, handlers['summarizer'])
+        full_transcript_text = textual_transcript.get('text', '')
+
+        # The summary depends only on the transcript and the summarizer model,
+        # so identical re-submissions are served from the cache.
+        summary_cache_key = SummaryCache.make_key(full_transcript_text, handlers['summarizer'].fingerprint)
+        long_form_summary = summary_cache.get(summary_cache_key)
+        if long_form_summary is None:
+            long_form_summary = summarizer_service.run(full_transcript_text, handlers['summarizer'])
+            if long_form_summary:
+                summary_cache.set(summary_cache_key, long_form_summary)
+        else:
+            app.logger.info(f"[{request_id}] Served long-form summary from cache.")
         
         # Dynamically determine the optimal number of concepts to generate.
         num_concepts_requested = request_data.get('request_context', {}).get('num_concepts_requested', 4)
@@ -142,14 +278,42 @@ def generate_shorts():
         if not concepts:
             return flask.jsonify({"status": "success", "results": []}), 200
 
-        # --- Pipeline Stage 3: Parallel Processing ---
-        # Use a thread pool to process each concept independently and concurrently,
-        # dramatically improving throughput for multi-concept requests.
-        final_results = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(process_single_concept, c, blocks_data, long_form_summary, handlers, request_id) for c in concepts]
-            for future in futures:
-                final_results.append(future.result())
+        # --- Pipeline Stage 3: Batched Concept Processing ---
+        # Every scripting service accepts the full concept list, so each stage
+        # runs as a single batched call instead of N single-concept calls in
+        # worker threads. This amortizes the RPC and prompt-prefix overhead
+        # (the rendered blocks context) across all concepts at once.
+        # Step 3a: Match all concepts to relevant transcript blocks.
+        concepts = matcher_service.run(concepts, block_lookup, handlers['concept_block_matcher'])
+        # Step 3b: Extract verbatim scripts for all concepts.
+        concepts = script_extractor_service.run(concepts, block_lookup, handlers['verbatim_script_extractor'])
+        # Step 3c: Perform a fast, offline search to find word indices for the scripts.
+        concepts = offline_indexer_service.run(concepts, block_lookup)
+
+        # Step 3d: Second wave for the LLM-based fallback indexer, covering
+        # only the individual chunks the offline indexer failed on. The chunk
+        # dicts are shared with their concepts, so updates land in place.
+        unindexed_chunks = [
+            chunk for c in concepts for chunk in c.get('script_chunks', [])
+            if 'start_word_index' not in chunk
+        ]
+        if unindexed_chunks:
+            llm_indexer_service.run_partial(unindexed_chunks, block_lookup, handlers['verbatim_indexer'])
+
+        # Step 3e: Evaluate the final scripts as a post-pass. Streaming
+        # clients keep per-concept evaluations so each concept can be flushed
+        # the moment it is scored; the default path sends all scripts in one
+        # batched evaluator call.
+        if request_data.get('request_context', {}).get('stream', False):
+            return flask.Response(
+                flask.stream_with_context(
+                    stream_concept_results(concepts, long_form_summary, handlers,
+                                           full_objects_transcript, id_map, request_id)
+                ),
+                mimetype='application/x-ndjson'
+            )
+
+        final_results = evaluate_concepts_batch(concepts, long_form_summary, handlers, request_id)
 
         # --- Pipeline Stage 4: Final Formatting ---
         client_output = output_formatter_service.run(final_results, full_objects_transcript, id_map)
@@ -2,6 +2,10 @@
 import logging
 from typing import Dict, List, Optional
 
+import numpy as np
+
+from ..utils.word_table import WordTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,12 +58,14 @@ class ChunkerService:
 
     def _chunk_words_into_blocks(self, words: List[Dict]) -> List[Dict]:
         """Iterates through words and groups them into coherent blocks."""
+        table = WordTable(words)
+
         blocks = []
         block_counter = 0
         current_word_index = 0
 
         while current_word_index < len(words):
-            end_index = self._find_block_end(words, current_word_index)
+            end_index = self._find_block_end(table, current_word_index)
             block_words = words[current_word_index : end_index + 1]
 
             block_obj = self._create_block_object(block_words, block_counter)
@@ -70,7 +76,7 @@ class ChunkerService:
             current_word_index = end_index + 1
         return blocks
 
-    def _find_block_end(self, words: List[Dict], start_index: int) -> int:
+    def _find_block_end(self, table: WordTable, start_index: int) -> int:
         """
         Determines the end index for a block based on a set of rules.
 
@@ -80,40 +86,47 @@ class ChunkerService:
            punctuation mark is found.
         3. The word count reaches the 'hard limit' (`block_max_words`).
         """
-        word_count = 0
-        initial_speaker = None
-
-        # Find the first 'word' type to determine the block's primary speaker.
-        for i in range(start_index, len(words)):
-            if words[i].get('type') == 'word':
-                initial_speaker = words[i].get('speaker_id')
-                break
-        
-        # If no speaker is found (e.g., only pauses left), end the block.
-        if initial_speaker is None:
-            return len(words) - 1
-
-        for i in range(start_index, len(words)):
-            word_data = words[i]
-            if word_data.get('type') != 'word':
-                continue
-
-            # Condition 1: Speaker change
-            if word_data.get('speaker_id') != initial_speaker:
-                return i - 1
-
-            word_count += 1
-            
-            # Condition 2: Soft limit break on sentence-ending punctuation
-            ends_with_punctuation = word_data['text'].strip().endswith(('.', '?', '!'))
-            if word_count > self.soft_word_limit and ends_with_punctuation:
-                return self._include_trailing_space_if_present(i, words)
-            
-            # Condition 3: Hard word count limit
-            if word_count >= self.block_max_words:
-                return self._include_trailing_space_if_present(i, words)
-
-        return len(words) - 1
+        word_positions = table.word_positions
+        ends_sentence = table.ends_sentence
+        change_positions = table.speaker_change_positions
+
+        # Locate the block's first actual word to determine its speaker.
+        first_word = int(np.searchsorted(word_positions, start_index))
+        if first_word == len(word_positions):
+            # No words left (e.g. only pauses); end the block at the transcript tail.
+            return len(table) - 1
+
+        # The index (into word_positions) of the last word this block may
+        # cover before the speaker changes. The change offsets are precomputed
+        # once per transcript, so this is a binary search per block rather
+        # than a comparison scan over the remaining words.
+        next_change = int(np.searchsorted(change_positions, first_word, side='right'))
+        speaker_changes = next_change < len(change_positions)
+        last_same_speaker = int(change_positions[next_change]) - 1 if speaker_changes else len(word_positions) - 1
+
+        # Condition 2: Soft limit break on sentence-ending punctuation. The
+        # word with count soft_word_limit + 1 sits at offset soft_word_limit.
+        soft_end = None
+        soft_start = first_word + self.soft_word_limit
+        if soft_start <= last_same_speaker:
+            punctuated = np.nonzero(ends_sentence[word_positions[soft_start : last_same_speaker + 1]])[0]
+            if punctuated.size:
+                soft_end = soft_start + int(punctuated[0])
+
+        # Condition 3: Hard word count limit.
+        hard_end = first_word + self.block_max_words - 1
+        if hard_end > last_same_speaker:
+            hard_end = None
+
+        limit_candidates = [end for end in (soft_end, hard_end) if end is not None]
+        if limit_candidates:
+            end_index = int(word_positions[min(limit_candidates)])
+            return self._include_trailing_space_if_present(end_index, table.words)
+
+        # Condition 1: Speaker change (or end of transcript).
+        if speaker_changes:
+            return int(word_positions[last_same_speaker + 1]) - 1
+        return len(table) - 1
 
     @staticmethod
     def _include_trailing_space_if_present(index: int, words: List[Dict]) -> int:
@@ -139,5 +152,8 @@ class ChunkerService:
             "start_time": word_list[0]['start'],
             "end_time": word_list[-1]['end'],
             "text": full_text,
+            # Short, already-stripped prefix used by downstream preview
+            # validation, so validators never touch the full block text.
+            "text_prefix": full_text[:256],
             "words": word_list
         }
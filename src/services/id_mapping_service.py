@@ -24,7 +24,8 @@ class IdMappingService:
         """
         Maps arbitrary client IDs to sequential integer IDs for robust processing.
 
-        This method executes a three-step process:
+        A single fused pass over the client items performs all three transforms
+        that previously required separate traversals:
         1.  Normalizes spacing by inserting standardized space objects.
         2.  Assigns a new, sequential integer ID to every object (words, pauses,
             spaces) and builds a map to link back to the original client IDs.
@@ -39,59 +40,62 @@ class IdMappingService:
 
         Returns:
             A tuple containing:
-            - textual_transcript (Dict): A transcript version for text processing.
+            - textual_transcript (Dict): A transcript version for text processing,
+              carrying its pre-joined full text under the 'text' key.
             - full_objects_transcript (Dict): A complete, indexed transcript.
             - id_map (Dict): A mapping from new integer IDs to original client IDs.
         """
         id_map = {}
-        full_objects_list = []
         original_items = transcript_data.get('words', [])
+        full_objects_list = []
+        final_textual_list = []
+        text_parts = []
+        next_id = 0
+
+        def append_textual(item: Dict) -> None:
+            text_parts.append(item.get('text', ''))
+            # Spacing timestamps must stretch to the following textual item so
+            # they fill the gaps left by removed pauses; a one-item lookback
+            # replaces the re-scan the old second pass performed.
+            if final_textual_list and final_textual_list[-1].get('type') == 'spacing':
+                final_textual_list[-1]['end'] = item.get('start')
+            final_textual_list.append(item)
 
-        # Step 1: Normalize the transcript by inserting standardized space objects
-        # between every original item to ensure consistent structure.
-        temp_list_with_spacing = []
         for item in original_items:
-            temp_list_with_spacing.append(item)
+            # Allocate exactly one dict per item (carrying the new ID) instead
+            # of copying the list twice; both transcript views share it.
+            new_item = {**item, 'id': next_id}
+            original_id = item.get('id')
+            if original_id is not None:
+                id_map[next_id] = original_id
+            next_id += 1
+
+            full_objects_list.append(new_item)
+            if new_item.get('type') != 'pause':
+                append_textual(new_item)
+
+            # Insert a standardized space object after every original item to
+            # ensure consistent structure.
             space_obj = {
                 "text": " ",
                 "start": item.get('end'),
                 "end": item.get('end'),
                 "type": "spacing",
-                "speaker_id": item.get('speaker_id')
+                "speaker_id": item.get('speaker_id'),
+                "id": next_id
             }
-            temp_list_with_spacing.append(space_obj)
-
-        # Step 2: Assign a sequential integer ID to every object and build the
-        # mapping from the new ID back to the original client ID.
-        for i, item_obj in enumerate(temp_list_with_spacing):
-            new_item = item_obj.copy()
-            original_id = new_item.get('id')
-            new_id = i
+            next_id += 1
 
-            new_item['id'] = new_id
-            if original_id is not None:
-                id_map[new_id] = original_id
-
-            full_objects_list.append(new_item)
-
-        # Step 3: Create a second, "textual" transcript version by filtering
-        # out non-essential types (like pauses) and refining spacing durations.
-        textual_objects_list_pre = [
-            item for item in full_objects_list if item.get('type') != 'pause'
-        ]
-
-        # Adjust spacing timestamps to fill the gaps left by removed pauses.
-        final_textual_list = []
-        for i, item in enumerate(textual_objects_list_pre):
-            if item.get('type') == 'spacing' and i < len(textual_objects_list_pre) - 1:
-                next_item = textual_objects_list_pre[i+1]
-                item['end'] = next_item.get('start')
-
-            final_textual_list.append(item)
+            full_objects_list.append(space_obj)
+            append_textual(space_obj)
 
-        # Assemble the final transcript objects for output.
+        # Assemble the final transcript objects for output. The textual
+        # transcript carries its full text, joined once from the parts
+        # collected during the pass above, so downstream consumers (the
+        # summarizer, prompt builders, content-hash caches) never re-join
+        # the word list.
         full_objects_transcript = {**transcript_data, 'words': full_objects_list}
-        textual_transcript = {**transcript_data, 'words': final_textual_list}
+        textual_transcript = {**transcript_data, 'words': final_textual_list, 'text': "".join(text_parts)}
 
         logger.info("Successfully processed and mapped transcript IDs.")
         return textual_transcript, full_objects_transcript, id_map
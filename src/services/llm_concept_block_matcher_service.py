@@ -28,22 +28,31 @@ class LlmConceptBlockMatcherService:
         """Initializes the block matcher service."""
         logger.info("LlmConceptBlockMatcherService initialized.")
 
-    def run(self, concepts_data: List[Dict], blocks_data: List[Dict], llm_handler: LlmApiHandler) -> List[Dict]:
+    def run(self, concepts_data: List[Dict], block_lookup: Dict[str, Dict], llm_handler: LlmApiHandler) -> List[Dict]:
         """
         Processes each concept to find and validate relevant transcript blocks.
 
         Args:
             concepts_data: A list of concept dictionaries to be processed.
-            blocks_data: A list of all available transcript blocks.
+            block_lookup: A mapping of block_id to block objects, built once
+                          per request by the orchestrator.
             llm_handler: An instance of the LLM handler for API communication.
 
         Returns:
             The list of concepts, augmented with a 'matched_blocks' key containing
             a list of validated block matches.
         """
-        block_lookup = {b['block_id']: b for b in blocks_data}
         augmented_concepts = []
 
+        # Validation data derived from the blocks is identical for every
+        # concept, so it is extracted once per run instead of once per
+        # concept inside the loop below.
+        validation_prefixes = {block_id: block['text_prefix'] for block_id, block in block_lookup.items()}
+        block_durations = {
+            block_id: block['end_time'] - block['start_time']
+            for block_id, block in block_lookup.items()
+        }
+
         for concept in concepts_data:
             logger.info(f"Finding matches for concept: \"{concept['title']}\"")
             try:
@@ -53,11 +62,11 @@ class LlmConceptBlockMatcherService:
 
                 # This validation logic is a key feature and is preserved to show
                 # how the system ensures the reliability of the LLM's output.
-                validated_matches = self._get_validated_matches(mock_llm_matches, block_lookup)
+                validated_matches = self._get_validated_matches(mock_llm_matches, validation_prefixes)
 
                 # Calculate total duration of only the successfully validated blocks.
                 total_duration = sum(
-                    block_lookup[match['block_id']]['end_time'] - block_lookup[match['block_id']]['start_time']
+                    block_durations[match['block_id']]
                     for match in validated_matches if match['is_validated']
                 )
                 concept['matched_blocks'] = validated_matches
@@ -72,7 +81,7 @@ class LlmConceptBlockMatcherService:
         
         return augmented_concepts
 
-    def _get_validated_matches(self, llm_matches: List[Dict], block_lookup: Dict) -> List[Dict]:
+    def _get_validated_matches(self, llm_matches: List[Dict], validation_prefixes: Dict[str, str]) -> List[Dict]:
         """
         Performs a verification loop on the LLM's suggested block matches.
 
@@ -92,9 +101,12 @@ class LlmConceptBlockMatcherService:
             preview = match.get("block_preview")
             is_validated = False
 
-            if block_id in block_lookup:
-                actual_text = block_lookup[block_id]['text']
-                if actual_text.strip().startswith(preview.strip()):
+            expected_prefix = validation_prefixes.get(block_id)
+            if expected_prefix is not None:
+                # The chunker stores a pre-stripped prefix of each block's
+                # text, so validation compares two short strings instead of
+                # re-stripping the full block text for every match.
+                if expected_prefix.startswith(preview.strip()):
                     is_validated = True
                 else:
                     logger.warning(f"Validation failed for '{block_id}': Preview '{preview}' did not match.")
@@ -0,0 +1,224 @@
+# src/services/llm_critic_service.py
+
+# Note: The implementation of this service has been removed to protect proprietary
+# intellectual property. The code below is a representation of the service's
+# structure and interface, designed to showcase its role in the pipeline.
+
+import logging
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# In the original implementation, this service relies on a utility class
+# for handling interactions with Large Language Models (LLMs).
+from ..utils.llm_handler import LlmApiHandler
+
+logger = logging.getLogger(__name__)
+
+
+# --- Wire Schemas ---
+# Constrained decoding still generates every key name token by token, so for
+# a critique with many findings the long field names themselves dominate the
+# output-token count. These wire models carry single-letter aliases: the
+# JSON Schema sent to the provider is generated with by_alias=True (the
+# model decodes 'cid', 's', 'j', ...), while the parsed objects expose the
+# long names — model_dump() rehydrates them for the rest of the pipeline,
+# and populate_by_name keeps long-name construction working in tests.
+
+class WireFinding(BaseModel):
+    """One scored rubric criterion, in wire-compact form."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    criterion_id: str = Field(alias='cid')
+    score: float = Field(alias='s')
+    justification: str = Field(alias='j')
+
+
+class WireRecommendation(BaseModel):
+    """One improvement recommendation, in wire-compact form."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    criterion_to_improve: str = Field(alias='c')
+    reasoning: str = Field(alias='r')
+    specific_suggestion: str = Field(alias='sug')
+
+# The full text of the proprietary evaluation rubric. Loaded once at import
+# so its bytes are identical on every call: provider-side prompt caching
+# keys on the exact leading bytes of the request, and any per-call
+# re-rendering of the rubric would defeat it. (Redacted in this public
+# version of the repository.)
+RUBRIC_TEXT = "[Proprietary multi-point evaluation rubric redacted]"
+
+
+class LlmCriticService:
+    """
+    Evaluates a script against the rubric and derives improvement recommendations,
+    in a single structured LLM call.
+
+    This service merges the former LlmScriptEvaluatorService ("Critic") and
+    LlmScriptRecommendationService ("script doctor"). As two services, the
+    recommender's second round trip re-sent the rubric, summary, and the
+    evaluation the critic had just produced; a combined structured-output
+    schema lets one call fill both the evaluation and the recommendations,
+    halving the round trips and the duplicated prompt context per concept.
+    """
+
+    def __init__(self):
+        """Initializes the critic service."""
+        logger.info("LlmCriticService initialized.")
+
+    @staticmethod
+    def _build_static_context(long_form_summary: str) -> str:
+        """
+        Assembles the invariant prompt prefix shared by every critique.
+
+        The rubric and the long-form summary are identical for all scripts in
+        a run, so they travel as the handler's `static_context` (a leading
+        system message) while only the script and concept vary per call. With
+        N concepts per run the prefix is re-sent N times but re-processed by
+        the provider only once.
+
+        The summary comes first, per the pipeline-wide prompt layout
+        convention (see LlmApiHandler._build_chain): every service that
+        includes the per-video summary places it at the very start of its
+        static context, so the summary bytes form a common prefix across
+        *different* services' calls and the provider cache built by one
+        service's calls is hit by the others'.
+        """
+        return f"{long_form_summary}\n\n{RUBRIC_TEXT}"
+
+    def run(
+        self,
+        script_text: str,
+        long_form_summary: str,
+        concept: Dict,
+        llm_handler: LlmApiHandler
+    ) -> Optional[Dict]:
+        """
+        Produces a structured evaluation and recommendations for one script.
+
+        The core IP of this service is the detailed, research-backed rubric
+        against which the script is scored (hook quality, narrative cohesion,
+        emotional impact, viral potential) and the multi-context prompting
+        strategy behind the recommendations, which are grounded in the
+        concept's title and logline and in the evaluation produced within
+        the same call.
+
+        Args:
+            script_text: The generated script to be critiqued.
+            long_form_summary: A summary of the original video for context.
+            concept: The original concept dictionary for the script.
+            llm_handler: An instance of the LLM handler for API communication.
+
+        Returns:
+            A dictionary with 'evaluation' and 'recommendations' keys, or
+            None on failure.
+        """
+        title = concept.get('title', 'N/A')
+        logger.info(f"Performing structured critique for script: \"{title}\"")
+
+        # --- Proprietary implementation removed ---
+        # The original implementation passes the rubric and summary to the LLM
+        # as `static_context` (see `_build_static_context`) and the script plus
+        # concept as the user prompt, with a combined Pydantic schema of the
+        # form CritiqueSchema(evaluation=..., recommendations=...) built from
+        # the wire models above. The response decodes with short aliases and
+        # is rehydrated to the long field names via model_dump() before being
+        # returned.
+
+        # Mock return value to demonstrate the expected output data shape.
+        mock_critique = {
+            "evaluation": {
+                "overall_summary": "This is a mock evaluation summary. The script shows strong potential.",
+                "overall_score": 4.5,
+                "fixed_criteria_findings": [
+                    {"criterion_id": "MOCK_CRITERION_1", "score": 4, "justification": "Mock justification for criterion 1."},
+                    {"criterion_id": "MOCK_CRITERION_2", "score": 5, "justification": "Mock justification for criterion 2."}
+                ],
+                "variable_criteria_findings": [],
+                "identified_attributes": {
+                    "narrative_structure": "Hook -> Backstory -> Pay-off"
+                }
+            },
+            "recommendations": {
+                "recommendations": [
+                    {
+                        "criterion_to_improve": "MOCK_HOOK_QUALITY",
+                        "reasoning": "The evaluation noted the hook was not engaging enough.",
+                        "specific_suggestion": "Try rewriting the first line to be: 'You won't believe this one secret...'"
+                    },
+                    {
+                        "criterion_to_improve": "MOCK_NARRATIVE_COHESION",
+                        "reasoning": "The score for cohesion was low because the transition is abrupt.",
+                        "specific_suggestion": "Consider adding a transitional phrase like 'But that's not all...' between the second and third paragraphs."
+                    }
+                ]
+            }
+        }
+
+        logger.info("Script critique finished (mock response).")
+        return mock_critique
+
+    async def arun(
+        self,
+        script_text: str,
+        long_form_summary: str,
+        concept: Dict,
+        llm_handler: LlmApiHandler
+    ) -> Optional[Dict]:
+        """
+        Async variant of `run`, used by the concurrent critique wave.
+
+        In the original implementation this awaits the handler's async
+        structured-output API, allowing all concepts' critiques to share one
+        event loop and connection pool instead of blocking a thread each.
+
+        Args:
+            script_text: The generated script to be critiqued.
+            long_form_summary: A summary of the original video for context.
+            concept: The original concept dictionary for the script.
+            llm_handler: An instance of the LLM handler for API communication.
+
+        Returns:
+            A dictionary with 'evaluation' and 'recommendations' keys, or
+            None on failure.
+        """
+        return self.run(script_text, long_form_summary, concept, llm_handler)
+
+    def run_batch(
+        self,
+        concepts: List[Dict],
+        long_form_summary: str,
+        llm_handler: LlmApiHandler
+    ) -> List[Optional[Dict]]:
+        """
+        Critiques several concepts' scripts with a single batched LLM call.
+
+        Every script in a pipeline run is scored against the same rubric and
+        the same long-form summary, so sending them as one numbered batch
+        amortizes that shared prompt prefix and collapses N critique round
+        trips into one.
+
+        Args:
+            concepts: Concept dictionaries carrying 'script', 'title', and
+                      'logline', in order.
+            long_form_summary: A summary of the original video for context.
+            llm_handler: An instance of the LLM handler for API communication.
+
+        Returns:
+            One critique dictionary (or None on failure) per input concept,
+            in the same order as `concepts`.
+        """
+        logger.info(f"Performing batched critique for {len(concepts)} scripts...")
+
+        # --- Proprietary implementation removed ---
+        # The original implementation renders all scripts and their concepts
+        # into a single numbered prompt, sends the shared rubric and summary
+        # once as `static_context` (see `_build_static_context`), then calls
+        # the LLM once with a list-valued combined schema and maps each
+        # returned critique back to its concept by position.
+
+        return [
+            self.run(concept.get('script', ''), long_form_summary, concept, llm_handler)
+            for concept in concepts
+        ]
@@ -1,82 +0,0 @@
-# src/services/llm_script_evaluator_service.py
-
-# Note: The implementation of this service has been removed to protect proprietary
-# intellectual property. The code below is a representation of the service's
-# structure and interface, designed to showcase its role in the pipeline.
-
-import logging
-from typing import Dict, Optional
-
-# In the original implementation, this service relies on a utility class
-# for handling interactions with Large Language Models (LLMs).
-from ..utils.llm_handler import LlmApiHandler
-
-logger = logging.getLogger(__name__)
-
-
-class LlmScriptEvaluatorService:
-    """
-    Evaluates a generated script against a proprietary, multi-point rubric.
-
-    This service acts as the "Critic" in the pipeline, providing a structured,
-    objective quality score for each generated script. It uses an LLM to assess
-    the script's potential for viewer engagement and viral success based on
-    research-backed criteria.
-    """
-
-    def __init__(self):
-        """Initializes the script evaluator service."""
-        logger.info("LlmScriptEvaluatorService initialized.")
-
-    def run(
-        self,
-        script_text: str,
-        long_form_summary: str,
-        llm_handler: LlmApiHandler
-    ) -> Optional[Dict]:
-        """
-        Performs a structured evaluation of a script's quality.
-
-        The core IP of this service is the detailed, research-backed rubric
-        against which the script is scored. The rubric includes multiple criteria
-        assessing factors such as:
-        - Hook Quality and Effectiveness
-        - Narrative Cohesion and Clarity
-        - Emotional Impact and Payoff
-        - Overall Viral Potential
-
-        The LLM is prompted to act as an expert viral video strategist, providing
-        a score and detailed justification for each criterion.
-
-        Args:
-            script_text: The generated script to be evaluated.
-            long_form_summary: A summary of the original video for context.
-            llm_handler: An instance of the LLM handler for API communication.
-
-        Returns:
-            A dictionary containing the detailed evaluation results, or None on failure.
-        """
-        logger.info("Performing structured evaluation for script...")
-
-        # --- Proprietary implementation removed ---
-        # The original implementation constructs a detailed prompt containing the
-        # script, the long-form summary, and the full text of a proprietary
-        # evaluation rubric. An LLM is then called with a complex Pydantic schema
-        # to generate the detailed, structured evaluation findings.
-
-        # Mock return value to demonstrate the expected output data shape.
-        mock_evaluation = {
-            "overall_summary": "This is a mock evaluation summary. The script shows strong potential.",
-            "overall_score": 4.5,
-            "fixed_criteria_findings": [
-                {"criterion_id": "MOCK_CRITERION_1", "score": 4, "justification": "Mock justification for criterion 1."},
-                {"criterion_id": "MOCK_CRITERION_2", "score": 5, "justification": "Mock justification for criterion 2."}
-            ],
-            "variable_criteria_findings": [],
-            "identified_attributes": {
-                "narrative_structure": "Hook -> Backstory -> Pay-off"
-            }
-        }
-
-        logger.info("Script evaluation finished (mock response).")
-        return mock_evaluation
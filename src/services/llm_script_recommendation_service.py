@@ -1,88 +0,0 @@
-# src/services/llm_script_recommendation_service.py
-
-# Note: The implementation of this service has been removed to protect proprietary
-# intellectual property. The code below is a representation of the service's
-# structure and interface, designed to showcase its role in the pipeline.
-
-import logging
-from typing import Dict, List, Optional
-
-# In the original implementation, this service relies on a utility class
-# for handling interactions with Large Language Models (LLMs).
-from ..utils.llm_handler import LlmApiHandler
-
-logger = logging.getLogger(__name__)
-
-
-class LlmScriptRecommendationService:
-    """
-    Generates actionable recommendations to improve a script based on its evaluation.
-
-    This service acts as an AI "script doctor." It analyzes the detailed feedback
-    from the LlmScriptEvaluatorService to provide specific, creative, and
-    context-aware suggestions for enhancing the script's viral potential.
-    """
-
-    def __init__(self):
-        """Initializes the script recommendation service."""
-        logger.info("LlmScriptRecommendationService initialized.")
-
-    def run(
-        self,
-        script_text: str,
-        evaluation_result: Dict,
-        long_form_summary: str,
-        concept: Dict,
-        llm_handler: LlmApiHandler
-    ) -> Optional[Dict]:
-        """
-        Generates a structured list of recommendations for script improvement.
-
-        The core IP of this service is its sophisticated multi-context prompting
-        strategy. The LLM is provided with a comprehensive set of documents:
-        - The original script to be improved.
-        - The video's creative concept (title and logline).
-        - A summary of the source material.
-        - The detailed, structured evaluation report from the "Critic" service.
-        - The proprietary rubric that was used to score the script.
-
-        By analyzing all these inputs together, the LLM can generate highly relevant
-        and actionable feedback that is grounded in the initial evaluation.
-
-        Args:
-            script_text: The generated script to be improved.
-            evaluation_result: The structured evaluation from the LlmScriptEvaluatorService.
-            long_form_summary: A summary of the original video for context.
-            concept: The original concept dictionary for the script.
-            llm_handler: An instance of the LLM handler for API communication.
-
-        Returns:
-            A dictionary containing a list of recommendations, or None on failure.
-        """
-        title = concept.get('title', 'N/A')
-        logger.info(f"Generating improvement recommendations for script: \"{title}\"")
-
-        # --- Proprietary implementation removed ---
-        # The original implementation constructs a complex, multi-part prompt
-        # containing all the contextual documents listed above. It then calls an
-        # LLM with a Pydantic schema to produce a structured list of recommendations,
-        # each targeting a specific criterion from the evaluation report.
-
-        # Mock return value to demonstrate the expected output data shape.
-        mock_recommendations = {
-            "recommendations": [
-                {
-                    "criterion_to_improve": "MOCK_HOOK_QUALITY",
-                    "reasoning": "The evaluation noted the hook was not engaging enough.",
-                    "specific_suggestion": "Try rewriting the first line to be: 'You won't believe this one secret...'"
-                },
-                {
-                    "criterion_to_improve": "MOCK_NARRATIVE_COHESION",
-                    "reasoning": "The score for cohesion was low because the transition is abrupt.",
-                    "specific_suggestion": "Consider adding a transitional phrase like 'But that's not all...' between the second and third paragraphs."
-                }
-            ]
-        }
-
-        logger.info("Script recommendation generation finished (mock response).")
-        return mock_recommendations
@@ -13,6 +13,12 @@ from ..utils.llm_handler import LlmApiHandler
 
 logger = logging.getLogger(__name__)
 
+# Unindexed chunks are grouped into batches of this size, each sent as one
+# LLM call. Large enough to amortize the shared source-block context across
+# a call, small enough that the list-valued response stays comfortably
+# within model output-token limits.
+CHUNK_BATCH_SIZE = 20
+
 
 class LlmVerbatimIndexerService:
     """
@@ -28,7 +34,7 @@ class LlmVerbatimIndexerService:
         """Initializes the LLM-based verbatim indexer service."""
         logger.info("LlmVerbatimIndexerService initialized.")
 
-    def run(self, scripts_data: List[Dict], blocks_data: List[Dict], llm_handler: LlmApiHandler) -> List[Dict]:
+    def run(self, scripts_data: List[Dict], block_lookup: Dict[str, Dict], llm_handler: LlmApiHandler) -> List[Dict]:
         """
         Processes script chunks that lack indices, using an LLM for a fuzzy search.
 
@@ -39,40 +45,67 @@ class LlmVerbatimIndexerService:
 
         Args:
             scripts_data: The list of concepts with their script chunks.
-            blocks_data: A list of all block objects with word-level data.
+            block_lookup: A mapping of block_id to block objects with word-level data.
             llm_handler: An instance of the LLM handler for API communication.
 
         Returns:
             The list of concepts, with indices added to any previously unindexed chunks.
         """
-        logger.info("Performing LLM-based fallback indexing for any unindexed chunks...")
-        
-        for concept in scripts_data:
-            processed_chunks = []
-            for chunk in concept.get('script_chunks', []):
-                # This service only processes chunks that the offline indexer failed on.
-                if 'start_word_index' in chunk:
-                    processed_chunks.append(chunk)
-                    continue
-                
-                chunk_text = chunk.get('chunk_text', '')[:30]
-                logger.info(f"Attempting fallback indexing for chunk: '{chunk_text}...'")
-
-                # --- Proprietary implementation removed ---
-                # The original service uses a specialized prompt to transform the source
-                # block into a mappable format (e.g., 'word|id|word|id|...'). The LLM
-                # reconstructs the chunk text using this format, and the service then
-                # parses the resulting string to extract the start and end word IDs.
-
-                # Mock data demonstrates the service's function of filling in missing indices.
+        # This service only processes chunks that the offline indexer failed on;
+        # already-indexed chunks never reach the LLM.
+        unindexed_chunks = [
+            chunk
+            for concept in scripts_data
+            for chunk in concept.get('script_chunks', [])
+            if 'start_word_index' not in chunk
+        ]
+        if unindexed_chunks:
+            self.run_partial(unindexed_chunks, block_lookup, llm_handler)
+
+        return scripts_data
+
+    def run_partial(self, chunks: List[Dict], block_lookup: Dict[str, Dict], llm_handler: LlmApiHandler) -> List[Dict]:
+        """
+        Indexes only the given unindexed chunks, updating them in place.
+
+        Receiving just the failed chunks keeps the LLM input proportional to
+        the offline indexer's miss rate: chunks that already carry indices are
+        never re-sent, and neither is the rest of their concept.
+
+        Args:
+            chunks: Script chunks that lack 'start_word_index'.
+            block_lookup: A mapping of block_id to block objects with word-level data.
+            llm_handler: An instance of the LLM handler for API communication.
+
+        Returns:
+            The same chunk list, with indices added where the LLM found them.
+        """
+        logger.info(f"Performing LLM-based fallback indexing for {len(chunks)} chunks...")
+
+        # Chunks are sent in grouped calls rather than one call each: a run's
+        # misses typically share a handful of source blocks, so batching
+        # collapses N round trips into ceil(N / CHUNK_BATCH_SIZE) and sends
+        # each block's mappable rendering once per group instead of once per
+        # chunk. Results map back to chunks by position within the group.
+        for group_start in range(0, len(chunks), CHUNK_BATCH_SIZE):
+            group = chunks[group_start : group_start + CHUNK_BATCH_SIZE]
+            logger.info(f"Fallback indexing a group of {len(group)} chunks...")
+
+            # --- Proprietary implementation removed ---
+            # The original service transforms each referenced source block into
+            # a mappable format (e.g., 'word|id|word|id|...') once per group,
+            # numbers the group's chunks into a single prompt, and calls the
+            # LLM once with a list-valued schema. The LLM reconstructs every
+            # chunk in the mappable format, and the service parses each
+            # returned string to extract that chunk's start and end word IDs.
+
+            # Mock data demonstrates the service's function of filling in missing indices.
+            for chunk in group:
                 mock_indices = {
                     "start_word_index": "c101_mock_id",
                     "end_word_index": "c105_mock_id"
                 }
                 chunk.update(mock_indices)
-                processed_chunks.append(chunk)
-            
-            concept['script_chunks'] = processed_chunks
 
         logger.info("LLM-based fallback indexing finished (mock responses).")
-        return scripts_data
+        return chunks
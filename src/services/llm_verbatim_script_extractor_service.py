@@ -27,7 +27,7 @@ class LlmVerbatimScriptExtractorService:
         """Initializes the script extractor service."""
         logger.info("LlmVerbatimScriptExtractorService initialized.")
 
-    def run(self, concepts_data: List[Dict], blocks_data: List[Dict], llm_handler: LlmApiHandler) -> List[Dict]:
+    def run(self, concepts_data: List[Dict], block_lookup: Dict[str, Dict], llm_handler: LlmApiHandler) -> List[Dict]:
         """
         Generates a verbatim script for each concept using a constrained LLM.
 
@@ -47,7 +47,8 @@ class LlmVerbatimScriptExtractorService:
 
         Args:
             concepts_data: A list of concepts, each with a 'matched_blocks' key.
-            blocks_data: A list of all available transcript blocks.
+            block_lookup: A mapping of block_id to block objects, used for O(1)
+                          access to each matched block's text.
             llm_handler: An instance of the LLM handler for API communication.
 
         Returns:
@@ -1,9 +1,10 @@
 # src/services/offline_indexer_service.py
+import bisect
 import logging
 from typing import List, Dict, Optional
 
-from ..utils.exact_sequence_matcher import ExactSequenceMatcher
-from ..utils.text_utils import normalize_word
+from ..utils.exact_sequence_matcher import BlockIndex, ExactSequenceMatcher, WORD_SEP
+from ..utils.text_utils import normalize_words_batch, tokenize_and_normalize
 
 logger = logging.getLogger(__name__)
 
@@ -24,28 +25,33 @@ class OfflineIndexerService:
         # This service delegates the core matching logic to a specialized utility.
         self.matcher = ExactSequenceMatcher()
 
-    def run(self, scripts_data: List[Dict], blocks_data: List[Dict]) -> List[Dict]:
+    def run(self, scripts_data: List[Dict], block_lookup: Dict[str, Dict]) -> List[Dict]:
         """
         Iterates through script chunks and attempts to find their word indices.
 
         Args:
             scripts_data: The list of concept objects, each containing script chunks.
-            blocks_data: The list of all block objects with word-level data.
+            block_lookup: A mapping of block_id to block objects with word-level data.
 
         Returns:
             The list of concepts, with indices added to the script chunks where found.
         """
-        block_lookup = {b['block_id']: b for b in blocks_data}
-        
+        # Normalized BlockIndex per block, filled lazily and shared by every
+        # chunk that references the same block. Chunks from one concept (and
+        # across concepts) overwhelmingly point at the same few source
+        # blocks, so without this the full block would be re-normalized and
+        # re-indexed once per chunk.
+        normalized_blocks: Dict[str, BlockIndex] = {}
+
         for concept in scripts_data:
             title = concept.get('title', 'N/A')
             logger.info(f"Performing offline indexing for concept: \"{title}\"")
-            
+
             processed_chunks = []
             for chunk in concept.get('script_chunks', []):
                 try:
                     # Attempt to find the start and end indices for the chunk.
-                    indices = self._find_indices_for_chunk(chunk, block_lookup)
+                    indices = self._find_indices_for_chunk(chunk, block_lookup, normalized_blocks)
                     if indices:
                         chunk.update(indices)
                     processed_chunks.append(chunk)
@@ -58,48 +64,115 @@ class OfflineIndexerService:
 
         return scripts_data
 
-    def _find_indices_for_chunk(self, chunk: Dict, block_lookup: Dict) -> Optional[Dict]:
+    @staticmethod
+    def _normalized_block_words(block_id: str, block_lookup: Dict,
+                                cache: Dict[str, BlockIndex]) -> Optional[BlockIndex]:
+        """
+        Returns the block's normalized BlockIndex, memoized per run.
+
+        Normalization involves lowercasing, removing punctuation, and
+        filtering out non-words. The index's parallel columns
+        (structure-of-arrays) replace per-word dicts, and its joined form
+        and word offsets serve both the substring fast path here and the
+        matcher's anchor scan.
+        """
+        index = cache.get(block_id)
+        if index is None:
+            source_block = block_lookup.get(block_id)
+            if not source_block:
+                return None
+            word_objects = [
+                word for word in source_block.get('words', [])
+                if word.get('type') != 'spacing'
+            ]
+            block_ids = [word['id'] for word in word_objects]
+            # The whole block is normalized in one batched pass rather than
+            # word by word; text_utils interns every result, so repeated
+            # tokens share one object and the matcher's equality checks
+            # short-circuit on pointer identity.
+            block_texts = normalize_words_batch([word['text'] for word in word_objects])
+            index = ExactSequenceMatcher.prepare_block(block_texts, block_ids)
+            cache[block_id] = index
+        return index
+
+    def _find_indices_for_chunk(self, chunk: Dict, block_lookup: Dict,
+                                normalized_blocks: Dict[str, BlockIndex]) -> Optional[Dict]:
         """
         Prepares data and calls the matcher utility to find indices for a single chunk.
-        
+
         Args:
             chunk: A dictionary representing a single script chunk.
             block_lookup: A dictionary mapping block_ids to block objects.
+            normalized_blocks: Per-run cache of normalized block indexes.
 
         Returns:
             A dictionary with 'start_word_index' and 'end_word_index', or None if not found.
         """
         source_block_id = chunk.get('source_block_id')
         chunk_text = chunk.get('chunk_text')
-        
+
         if not source_block_id or not chunk_text:
             return None
 
-        source_block = block_lookup.get(source_block_id)
-        if not source_block:
+        # 1. Fetch the source block's index (computed at most once per block
+        #    per run, however many chunks reference it).
+        block_index = self._normalized_block_words(source_block_id, block_lookup, normalized_blocks)
+        if block_index is None:
             logger.warning(f"Source block '{source_block_id}' not found for chunk.")
             return None
 
-        # --- Data Preparation for Robust Matching ---
-
-        # 1. Normalize the source block's words for a clean comparison. This
-        #    involves lowercasing, removing punctuation, and filtering out non-words.
-        block_words_unfiltered = source_block.get('words', [])
-        normalized_block_words = [
-            {'id': word['id'], 'text': normalize_word(word['text'])}
-            for word in block_words_unfiltered
-            if word.get('type') != 'spacing'
-        ]
-
-        # 2. Normalize the chunk's text into a comparable list of words.
-        chunk_words_list = chunk_text.split()
-        normalized_chunk_words = [
-            {'id': i, 'text': normalize_word(word)}
-            for i, word in enumerate(chunk_words_list)
-        ]
-
-        # 3. Delegate to the sequence matcher with the prepared, normalized data.
-        return self.matcher.find_match(
-            chunk_words=normalized_chunk_words,
-            block_words=normalized_block_words
-        )
+        # 2. Tokenize and normalize the chunk's text in one fused step
+        #    (interned by text_utils, so comparisons against block words are
+        #    pointer-equal whenever the texts match).
+        chunk_texts = tokenize_and_normalize(chunk_text)
+
+        # 3. Fast path: locate the chunk as a single substring of the joined
+        #    block text — the search runs inside str.find (C-level memmem)
+        #    instead of a Python loop over candidate positions.
+        indices = self._find_by_substring(chunk_texts, block_index)
+        if indices is not None:
+            return indices
+
+        # 4. Fall back to the boundary-based sequence matcher.
+        return self.matcher.find_match(chunk_texts=chunk_texts, prepared=block_index)
+
+    @staticmethod
+    def _find_by_substring(chunk_texts: List[str], block_index: BlockIndex) -> Optional[Dict]:
+        """
+        Locates a chunk inside the block's joined text via str.find.
+
+        A hit only counts when it falls on word boundaries and aligns with a
+        word's start offset, so partial-word matches ("art" inside "start")
+        are rejected and the character position maps back to a word index by
+        binary search over the precomputed offsets.
+
+        Returns:
+            The usual index dictionary, or None if no aligned match exists
+            (the caller then falls back to the sequence matcher).
+        """
+        chunk_str = WORD_SEP.join(chunk_texts)
+        if not chunk_str:
+            return None
+
+        block_str = block_index.joined
+        word_starts = block_index.word_starts
+        block_ids = block_index.ids
+        block_len = len(block_str)
+        search_from = 0
+        while True:
+            found_at = block_str.find(chunk_str, search_from)
+            if found_at == -1:
+                return None
+
+            end = found_at + len(chunk_str)
+            if ((found_at == 0 or block_str[found_at - 1] == WORD_SEP)
+                    and (end == block_len or block_str[end] == WORD_SEP)):
+                start_word = bisect.bisect_left(word_starts, found_at)
+                end_word = start_word + len(chunk_texts) - 1
+                if (start_word < len(word_starts) and word_starts[start_word] == found_at
+                        and end_word < len(block_ids)):
+                    return {
+                        "start_word_index": block_ids[start_word],
+                        "end_word_index": block_ids[end_word]
+                    }
+            search_from = found_at + 1
@@ -2,6 +2,8 @@
 import logging
 from typing import List, Dict
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,30 +34,71 @@ class OutputFormatterService:
         Returns:
             A list of formatted, client-ready concept dictionaries.
         """
+        # Error concepts only echo identifying fields back, so a batch with
+        # no successes (e.g. a failed critique stage) skips the transcript
+        # indexing below entirely.
+        if not any(concept.get('status') != 'error' for concept in pipeline_results):
+            return [self._format_error_concept(concept) for concept in pipeline_results]
+
+        all_objects_list = full_objects_transcript.get('words', [])
+
+        # Shared per-transcript lookup structures, built once per run rather
+        # than once per concept. The client-id column is precomputed so that
+        # remapping a chunk becomes an array slice instead of a per-object
+        # dict lookup loop; entries without a client id (inserted spacing
+        # objects) are None in the column.
+        #
+        # The id-mapping service assigns internal IDs sequentially as it
+        # builds this very list, so an object's id *is* its list position
+        # and the position map is the identity. The endpoints are checked
+        # cheaply; should a future producer break the invariant, the
+        # explicit map is built as before.
+        count = len(all_objects_list)
+        ids_are_positions = (
+            count > 0 and all_objects_list[0]['id'] == 0 and all_objects_list[-1]['id'] == count - 1
+        )
+        id_to_position_map = None if ids_are_positions else {
+            obj['id']: i for i, obj in enumerate(all_objects_list)
+        }
+        client_ids = np.array([id_map.get(obj['id']) for obj in all_objects_list], dtype=object)
+        starts = np.array([obj['start'] for obj in all_objects_list], dtype=np.float64)
+        ends = np.array([obj['end'] for obj in all_objects_list], dtype=np.float64)
+
         client_results = []
         for concept in pipeline_results:
             # Pass through any concepts that errored during the pipeline.
             if concept.get('status') == 'error':
-                client_results.append({
-                    "title": concept.get('title'),
-                    "title_id": concept.get('title_id'),
-                    "logline": concept.get('logline'),
-                    "status": "error",
-                    "error_message": concept.get('error_message', 'An unknown error occurred.')
-                })
+                client_results.append(self._format_error_concept(concept))
                 continue
-            
-            formatted_concept = self._format_single_concept(concept, full_objects_transcript, id_map)
+
+            formatted_concept = self._format_single_concept(concept, id_to_position_map, client_ids, starts, ends)
             client_results.append(formatted_concept)
-            
+
         return client_results
 
-    def _format_single_concept(self, concept: Dict, full_objects_transcript: Dict, id_map: Dict) -> Dict:
-        """Formats one concept, remapping internal IDs back to client IDs."""
-        all_objects_list = full_objects_transcript.get('words', [])
-        # Create a lookup for O(1) access to an object's position by its internal ID.
-        id_to_position_map = {obj['id']: i for i, obj in enumerate(all_objects_list)}
+    @staticmethod
+    def _format_error_concept(concept: Dict) -> Dict:
+        """Formats a concept that errored during the pipeline."""
+        return {
+            "title": concept.get('title'),
+            "title_id": concept.get('title_id'),
+            "logline": concept.get('logline'),
+            "status": "error",
+            "error_message": concept.get('error_message', 'An unknown error occurred.')
+        }
 
+    @staticmethod
+    def _format_single_concept(concept: Dict, id_to_position_map: Dict,
+                               client_ids: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Dict:
+        """
+        Formats one concept, remapping internal IDs back to client IDs.
+
+        A pure function of its arguments. Deliberately kept serial: after the
+        per-run hoists, formatting a concept is a few array slices over a
+        handful of chunks — parallelizing across processes would spend far
+        more pickling the transcript columns into each worker than the loop
+        costs, and Lambda grants too few vCPUs for it to pay off anyway.
+        """
         total_duration = 0.0
         chunk_index_lists = []
         remapped_script_chunks = []
@@ -68,27 +111,30 @@ class OutputFormatterService:
                 continue
 
             # Step 1: Find the list positions of the start and end words.
-            start_pos = id_to_position_map.get(start_word_id)
-            end_pos = id_to_position_map.get(end_word_id)
-
-            if start_pos is None or end_pos is None:
+            # With sequential internal IDs the id is the position; the map
+            # only exists when that invariant did not hold.
+            if id_to_position_map is None:
+                total = len(client_ids)
+                start_pos = start_word_id if isinstance(start_word_id, int) and 0 <= start_word_id < total else None
+                end_pos = end_word_id if isinstance(end_word_id, int) and 0 <= end_word_id < total else None
+            else:
+                start_pos = id_to_position_map.get(start_word_id)
+                end_pos = id_to_position_map.get(end_word_id)
+
+            if start_pos is None or end_pos is None or end_pos < start_pos:
                 continue
 
-            # Step 2: Slice the full transcript to get every object (words, spaces) in the chunk.
-            full_slice = all_objects_list[start_pos : end_pos + 1]
-            if not full_slice:
-                continue
-            
-            # Step 3: Remap the internal IDs back to the original client string IDs.
-            remapped_ids = [id_map.get(obj['id']) for obj in full_slice if obj['id'] in id_map]
-            chunk_index_lists.append([rid for rid in remapped_ids if rid is not None])
+            # Step 2: Remap the internal IDs back to the original client
+            # string IDs via one slice of the precomputed column.
+            chunk_client_ids = client_ids[start_pos : end_pos + 1]
+            chunk_index_lists.append([cid for cid in chunk_client_ids.tolist() if cid is not None])
 
-            # Step 4: Calculate duration and format the chunk for the client output.
-            total_duration += (full_slice[-1]['end'] - full_slice[0]['start'])
+            # Step 3: Calculate duration and format the chunk for the client output.
+            total_duration += float(ends[end_pos] - starts[start_pos])
             remapped_script_chunks.append({
                 "chunk_text": chunk.get('chunk_text'),
-                "start_word_index": id_map.get(start_word_id),
-                "end_word_index": id_map.get(end_word_id)
+                "start_word_index": client_ids[start_pos],
+                "end_word_index": client_ids[end_pos]
             })
 
         return {
@@ -0,0 +1,65 @@
+# src/utils/background_loop.py
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from typing import Coroutine
+
+logger = logging.getLogger(__name__)
+
+# --- Shared Background Event Loop ---
+# The pipeline's async fan-out runs from synchronous Flask handlers, which
+# previously meant spinning up (and tearing down) a fresh event loop per
+# request. A single loop on a daemon thread amortizes that setup and lets
+# the pooled async HTTP client keep its connections warm across requests,
+# since an httpx.AsyncClient is bound to the loop it first runs on.
+_loop: asyncio.AbstractEventLoop = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the process-wide background event loop, starting it lazily.
+
+    The loop runs forever on a daemon thread; callers submit coroutines to
+    it via `run_coroutine` rather than driving it directly.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="pipeline-io-loop", daemon=True)
+            thread.start()
+            _loop = loop
+            logger.info("Started background asyncio event loop thread.")
+    return _loop
+
+
+def run_coroutine(coro: Coroutine) -> concurrent.futures.Future:
+    """
+    Schedules a coroutine on the background loop from any thread.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        A concurrent.futures.Future resolving to the coroutine's result,
+        usable with `concurrent.futures.as_completed` from synchronous code.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+
+def shutdown_background_loop() -> None:
+    """Stops the background loop; pending callbacks are abandoned."""
+    global _loop
+    with _loop_lock:
+        if _loop is not None:
+            _loop.call_soon_threadsafe(_loop.stop)
+            _loop = None
+            logger.info("Background event loop stopped.")
+
+
+# The thread is a daemon, so this is belt-and-braces cleanup for interpreter
+# shutdown rather than a correctness requirement.
+atexit.register(shutdown_background_loop)
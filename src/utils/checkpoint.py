@@ -0,0 +1,89 @@
+# src/utils/checkpoint.py
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    Disk-backed store for completed per-concept stage results.
+
+    The LLM response cache (see ResponseCache) keys on exact prompt bytes,
+    which is the wrong granularity for resuming a failed run: any prompt
+    tweak between runs invalidates it. Checkpoints key on *what was
+    computed* — the stage, the source context, and the item — so a rerun
+    after a failure on concept 47 of 50 reloads the 46 finished critiques
+    and only pays for the rest.
+
+    Opt-in via the PIPELINE_CHECKPOINT_DIR environment variable, following
+    the same conventions as the other disk tiers: off by default (Lambda's
+    filesystem is read-only outside /tmp), one JSON file per key, atomic
+    writes.
+    """
+
+    def __init__(self, checkpoint_dir: Optional[str] = None):
+        """
+        Initializes the store, resolving configuration from the environment.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint entries. Defaults to
+                            the PIPELINE_CHECKPOINT_DIR environment variable;
+                            when unset, the store is disabled.
+        """
+        self.checkpoint_dir = checkpoint_dir or os.environ.get('PIPELINE_CHECKPOINT_DIR')
+        self.enabled = bool(self.checkpoint_dir)
+        if self.enabled:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            logger.info(f"Checkpoint store enabled at '{self.checkpoint_dir}'.")
+
+    @staticmethod
+    def make_key(stage: str, context_text: str, item_id: str) -> str:
+        """
+        Builds a stable checkpoint key for one item of one stage.
+
+        Args:
+            stage: The pipeline stage name (e.g. 'critique').
+            context_text: The shared context the stage ran against (e.g. the
+                          long-form summary); hashed so the key tracks the
+                          source video, not the prompt wording.
+            item_id: The per-item identifier (e.g. the concept's title_id).
+
+        Returns:
+            A compact string key.
+        """
+        digest = hashlib.blake2b(context_text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{stage}:{digest}:{item_id}"
+
+    def _path_for(self, key: str) -> str:
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.checkpoint_dir, f"{name}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Returns the stored result for `key`, or None if absent."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint read failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Stores `value` under `key`, atomically via rename."""
+        if not self.enabled:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.checkpoint_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path_for(key))
+        except OSError as e:
+            logger.warning(f"Checkpoint write failed for {key}: {e}")
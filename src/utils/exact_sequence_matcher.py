@@ -1,45 +1,129 @@
 # src/utils/exact_sequence_matcher.py
+import bisect
 import logging
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 
+# Separator used when joining a block's words into one searchable string.
+# It cannot occur inside a normalized word, so word boundaries in the
+# joined form are unambiguous — unlike a space join, where empty normalized
+# words ("..." etc.) would collapse into their neighbours.
+WORD_SEP = "\x1f"
+
+
+@dataclass(slots=True)
+class BlockIndex:
+    """
+    Searchable structure-of-arrays form of one block's words.
+
+    The parallel columns replace per-word dicts: scans touch only `texts`
+    and `joined`, and `ids` is read once to build a result. `joined` is the
+    texts joined on WORD_SEP and `word_starts` holds each word's character
+    offset within it — strictly increasing (every word advances by its
+    length plus one separator), so an aligned hit in `joined` maps back to
+    exactly one word by binary search.
+
+    Built once per block via `ExactSequenceMatcher.prepare_block` and cached
+    by the caller for however many chunks query the block.
+    """
+    ids: List
+    texts: List[str]
+    joined: str
+    word_starts: List[int]
+
+
 class ExactSequenceMatcher:
     """
     Finds an exact sequence of words within a larger list of words.
 
-    This utility implements a custom, efficient, boundary-based checking algorithm.
-    Instead of a naive word-by-word comparison for long sequences, it optimizes the
-    search by primarily checking the first and last pairs of words in the target
-    sequence, making it fast and effective for its specific use case.
+    This utility locates candidate starting positions by searching for the
+    target's first word pair inside the block's joined text, then verifies
+    each candidate with a single C-level sequence comparison. Historically
+    it checked only the first and last word pairs and assumed the middle
+    matched; the full verification is now cheap enough (interned words make
+    it a pointer-compare loop) that the shortcut and its false positives
+    are gone.
+
+    The scan is deliberately kept as pure Python over CPython's C-level
+    string primitives (str.find on the joined block) rather than a JIT'd
+    or ahead-of-time-compiled kernel: transcripts top out at a few thousand
+    words, so the anchor search is already memory-bound C code. A JIT
+    dependency would add a large deployment image and a multi-second
+    first-call compile to every Lambda cold start, and a Cython extension
+    would turn the pure-Python Lambda bundle into a per-platform native
+    build with an import-time fallback to this same code — either way, no
+    measurable steady-state win. A side benefit: with no kernels to
+    compile, there is nothing to pre-warm at import, and a cold start pays
+    only the module import itself.
     """
     def __init__(self):
         """Initializes the ExactSequenceMatcher."""
         logging.info("ExactSequenceMatcher initialized.")
 
-    def find_match(self, chunk_words: List[Dict], block_words: List[Dict]) -> Optional[Dict]:
+    @staticmethod
+    def prepare_block(block_texts: List[str], block_ids: List) -> BlockIndex:
+        """
+        Precomputes the searchable form of a block for repeated queries.
+
+        Many chunks are matched against the same block, and without this the
+        join and offset build would be repeated per chunk. The index is
+        returned to the caller to cache for the block's lifetime rather
+        than memoized here on id(block_texts): id() values are reused once
+        an object is collected, so an identity-keyed cache can silently
+        serve one block's data for another.
+
+        Args:
+            block_texts: Normalized word texts for the source block.
+            block_ids: Original transcript IDs parallel to `block_texts`.
+
+        Returns:
+            A BlockIndex accepted by `find_match`'s `prepared` argument.
+        """
+        joined = WORD_SEP.join(block_texts)
+        word_starts = []
+        position = 0
+        for text in block_texts:
+            word_starts.append(position)
+            position += len(text) + 1
+        return BlockIndex(ids=block_ids, texts=block_texts, joined=joined, word_starts=word_starts)
+
+    def find_match(self, chunk_texts: List[str], block_texts: Optional[List[str]] = None,
+                   block_ids: Optional[List] = None,
+                   prepared: Optional[BlockIndex] = None) -> Optional[Dict]:
         """
         Finds the start and end original IDs of a chunk within a block.
 
+        The inputs are parallel columns (structure-of-arrays): the scan
+        below touches only the text columns, and the id column is indexed
+        once to build the final result.
+
         Args:
-            chunk_words: A list of normalized word dictionaries for the script chunk.
-            block_words: A list of normalized word dictionaries for the source block.
+            chunk_texts: Normalized word texts for the script chunk.
+            block_texts: Normalized word texts for the source block; may be
+                         omitted when `prepared` is given.
+            block_ids: Original transcript IDs parallel to `block_texts`;
+                       may be omitted when `prepared` is given.
+            prepared: The block's precomputed BlockIndex from
+                      `prepare_block`; built on the fly when omitted.
 
         Returns:
             A dictionary with 'start_word_index' and 'end_word_index' (which are
             the original IDs from the transcript), or None if no match is found.
         """
-        chunk_len = len(chunk_words)
-        if not chunk_words or not block_words:
-            return None
+        if prepared is None:
+            prepared = self.prepare_block(block_texts, block_ids)
+        block_texts = prepared.texts
+        block_ids = prepared.ids
 
-        # Prepare simple lists of the text content for efficient comparison.
-        chunk_text_list = [w['text'] for w in chunk_words]
-        block_text_list = [w['text'] for w in block_words]
+        chunk_len = len(chunk_texts)
+        if not chunk_texts or not block_texts:
+            return None
 
         # --- Tiered Logic: Handle single-word chunks separately for efficiency ---
         if chunk_len == 1:
             try:
-                match_index = block_text_list.index(chunk_text_list[0])
-                matched_word_id = block_words[match_index]['id']
+                match_index = block_texts.index(chunk_texts[0])
+                matched_word_id = block_ids[match_index]
                 return {
                     "start_word_index": matched_word_id,
                     "end_word_index": matched_word_id
@@ -47,29 +131,82 @@ class ExactSequenceMatcher:
             except ValueError:
                 return None  # Word not found in the block.
 
-        # --- Boundary-Based Algorithm for chunks of 2 or more words ---
-        elif chunk_len >= 2:
-            first_pair = chunk_text_list[:2]
-            last_pair = chunk_text_list[-2:]
-            # The distance between the start of the first pair and the start of the last pair.
-            expected_distance = chunk_len - 2
-
-            # Iterate through all possible starting positions in the block.
-            for i in range(len(block_text_list) - chunk_len + 1):
-                # Step 1: Check if the first two words of the chunk match.
-                if block_text_list[i : i + 2] == first_pair:
-                    # If the first boundary matches, calculate where the last boundary should be.
-                    last_pair_start_index = i + expected_distance
-                    
-                    # Step 2: Check if the last two words also match at the expected position.
-                    if block_text_list[last_pair_start_index : last_pair_start_index + 2] == last_pair:
-                        # Success! Both boundaries match. Assume the middle is also a match.
-                        start_word_id = block_words[i]['id']
-                        end_word_id = block_words[i + chunk_len - 1]['id']
-                        return {
-                            "start_word_index": start_word_id,
-                            "end_word_index": end_word_id
-                        }
-        
-        # If the loop completes, no match was found.
+        # --- Tiered Logic: two-word chunks are exactly one anchor hit ---
+        # For chunk_len == 2 the anchor below *is* the whole chunk, so an
+        # aligned hit is already a full match; running the general path
+        # would re-verify the same two words as the "last pair".
+        elif chunk_len == 2:
+            block_joined = prepared.joined
+            word_starts = prepared.word_starts
+
+            anchor = chunk_texts[0] + WORD_SEP + chunk_texts[1]
+            second_word = chunk_texts[1]
+            block_len = len(block_texts)
+            # Bound methods are resolved once; inside the loop each call is
+            # then a plain local load instead of an attribute lookup.
+            find = block_joined.find
+            bisect_left = bisect.bisect_left
+
+            pos = find(anchor)
+            while pos != -1:
+                i = bisect_left(word_starts, pos)
+                if (i + 1 < block_len and word_starts[i] == pos
+                        and block_texts[i + 1] == second_word):
+                    return {
+                        "start_word_index": block_ids[i],
+                        "end_word_index": block_ids[i + 1]
+                    }
+                pos = find(anchor, pos + 1)
+            return None
+
+        # --- Anchor scan with full verification for chunks of 3 or more ---
+        # Candidate starting positions are located with str.find over the
+        # block's joined form rather than a Python-level loop slicing every
+        # index: the anchor scan then runs inside CPython's C substring
+        # search, and Python code only executes once per anchor hit.
+        # str.find implements the Crochemore-Perrin two-way algorithm
+        # (sublinear skips, O(N+K) worst case), so it already provides what
+        # a hand-rolled rolling-hash scan would — without hash collisions
+        # to re-verify or a compiled-kernel dependency.
+        elif chunk_len >= 3:
+            block_joined = prepared.joined
+            word_starts = prepared.word_starts
+
+            # The two-word pair is the candidate filter: its occurrence count
+            # is at most that of the rarer of the two words, so this prunes
+            # at least as hard as a word->positions index would, without
+            # paying an O(N) dict build per call.
+            anchor = chunk_texts[0] + WORD_SEP + chunk_texts[1]
+            last_word = chunk_texts[-1]
+            block_len = len(block_texts)
+            # Bound methods are resolved once; inside the loop each call is
+            # then a plain local load instead of an attribute lookup.
+            find = block_joined.find
+            bisect_left = bisect.bisect_left
+
+            pos = find(anchor)
+            while pos != -1:
+                # A hit only counts when it starts exactly at a word boundary
+                # (so the first word *equals* chunk_texts[0] rather than
+                # merely ending with it). The candidate's last word is
+                # checked by direct element access — no allocation, and it
+                # rejects most false anchors immediately — before the full
+                # C-level list equality confirms the whole span: the earlier
+                # versions checked only the first and last pairs and assumed
+                # the middle matched, a correctness shortcut, while the full
+                # compare is both sound and cheap — with interned words each
+                # element check is a pointer identity test, short-circuiting
+                # on the first mismatch.
+                i = bisect_left(word_starts, pos)
+                if (i < block_len and word_starts[i] == pos
+                        and i + chunk_len <= block_len
+                        and block_texts[i + chunk_len - 1] == last_word
+                        and block_texts[i : i + chunk_len] == chunk_texts):
+                    return {
+                        "start_word_index": block_ids[i],
+                        "end_word_index": block_ids[i + chunk_len - 1]
+                    }
+                pos = find(anchor, pos + 1)
+
+        # If the scan completes, no match was found.
         return None
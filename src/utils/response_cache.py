@@ -0,0 +1,96 @@
+# src/utils/response_cache.py
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Disk-backed, exact-key cache for structured LLM responses.
+
+    Re-running the pipeline over the same transcript (the common case while
+    iterating on prompts or downstream code) re-issues byte-identical LLM
+    calls. This cache keys each call by a hash of everything that determines
+    its output — model fingerprint, prompt, schema, and generation
+    parameters — and stores the validated response JSON as one file per key,
+    so re-runs answer in microseconds instead of seconds. Because entries
+    survive the process, a pipeline run that fails partway through does not
+    re-pay the calls that already completed.
+
+    The cache is opt-in via the PIPELINE_LLM_CACHE=1 environment variable:
+    on AWS Lambda the filesystem is read-only outside /tmp, and in
+    production identical calls are rare enough that the disk round trip is
+    not worth it. The storage layer is plain JSON files under a content-hash
+    filename, which needs no extra dependency and keeps entries greppable.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initializes the cache, resolving configuration from the environment.
+
+        Args:
+            cache_dir: Directory for cache entries. Defaults to the
+                       PIPELINE_LLM_CACHE_DIR environment variable, falling
+                       back to './.llm_cache'.
+        """
+        self.enabled = os.environ.get('PIPELINE_LLM_CACHE', '0') == '1'
+        self.cache_dir = cache_dir or os.environ.get('PIPELINE_LLM_CACHE_DIR', '.llm_cache')
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            logger.info(f"LLM response cache enabled at '{self.cache_dir}'.")
+
+    @staticmethod
+    def make_key(fingerprint: str, prompt: str, schema_json: str, generation_params: Dict,
+                 static_context: str = "") -> str:
+        """
+        Derives a stable cache key from everything that determines a response.
+
+        Args:
+            fingerprint: The handler's provider:model identity.
+            prompt: The exact user prompt sent to the LLM.
+            schema_json: A canonical JSON dump of the output schema.
+            generation_params: Runtime parameters such as temperature.
+            static_context: The static prompt prefix, if any.
+
+        Returns:
+            A hex digest usable as a filename.
+        """
+        hasher = hashlib.sha256()
+        for part in (fingerprint, static_context, prompt, schema_json,
+                     json.dumps(generation_params, sort_keys=True, default=str)):
+            hasher.update(part.encode('utf-8'))
+            hasher.update(b'\x00')
+        return hasher.hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached response JSON for `key`, or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"LLM response cache read failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, payload_json: str) -> None:
+        """Stores `payload_json` under `key`, atomically via rename."""
+        if not self.enabled:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload_json)
+            os.replace(tmp_path, self._path_for(key))
+        except OSError as e:
+            logger.warning(f"LLM response cache write failed for {key}: {e}")
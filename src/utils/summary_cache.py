@@ -0,0 +1,125 @@
+# src/utils/summary_cache.py
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """
+    Two-tier cache for long-form transcript summaries.
+
+    A summary depends only on the transcript text and the model that produced
+    it, so repeat uploads, A/B evaluations, and dev iterations on the same
+    transcript can skip one of the most expensive LLM calls in the pipeline.
+    Entries are keyed by a content hash of the transcript plus the handler
+    fingerprint.
+
+    Tier one is in-process, with a bounded entry count and LRU eviction.
+    Tier two is an optional on-disk store (one file per entry, same layout
+    as the LLM response cache), enabled by setting the
+    PIPELINE_SUMMARY_CACHE_DIR environment variable; it lets summaries
+    survive process restarts and be shared between workers on one host.
+    Disk hits are promoted back into the memory tier.
+
+    Near-duplicate transcripts (minor ASR differences) hash to different
+    keys and are treated as misses: a semantic-similarity tier would need an
+    embedding model in the image, which outweighs its hit rate here, where
+    re-runs are typically byte-identical.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = None):
+        """
+        Initializes the cache, resolving the disk tier from the environment.
+
+        Args:
+            max_entries: Maximum number of summaries retained in memory
+                         before the least recently used entry is evicted.
+            cache_dir: Directory for the disk tier. Defaults to the
+                       PIPELINE_SUMMARY_CACHE_DIR environment variable;
+                       when unset, the disk tier is disabled.
+        """
+        logger.info("SummaryCache initialized.")
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_dir = cache_dir or os.environ.get('PIPELINE_SUMMARY_CACHE_DIR')
+        if self._cache_dir:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            logger.info(f"Summary disk cache enabled at '{self._cache_dir}'.")
+
+    @staticmethod
+    def make_key(transcript_text: str, handler_fingerprint: str) -> str:
+        """
+        Builds a stable cache key from the transcript content and the model.
+
+        Args:
+            transcript_text: The complete transcript text being summarized.
+            handler_fingerprint: The provider/model fingerprint of the handler
+                                 that would generate the summary.
+
+        Returns:
+            A compact string key combining a content digest and the fingerprint.
+        """
+        digest = hashlib.blake2b(transcript_text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{digest}:{handler_fingerprint}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached summary for `key`, or None on a miss."""
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is not None:
+                self._entries.move_to_end(key)
+                return summary
+
+        summary = self._disk_get(key)
+        if summary is not None:
+            # Promote the disk hit so subsequent lookups stay in memory.
+            self._memory_set(key, summary)
+        return summary
+
+    def set(self, key: str, summary: str) -> None:
+        """Stores a summary under `key` in both tiers (write-through)."""
+        self._memory_set(key, summary)
+        self._disk_set(key, summary)
+
+    def _memory_set(self, key: str, summary: str) -> None:
+        with self._lock:
+            self._entries[key] = summary
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        # Keys contain the fingerprint (with ':' and '/' candidates), so the
+        # filename is a digest of the key rather than the key itself.
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{name}.txt")
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if not self._cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Summary disk cache read failed: {e}")
+            return None
+
+    def _disk_set(self, key: str, summary: str) -> None:
+        if not self._cache_dir:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(summary)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"Summary disk cache write failed: {e}")
@@ -1,9 +1,72 @@
 # src/utils/text_utils.py
+import functools
 import re
 import string
+import sys
+from typing import List
 
+# Translation table deleting all punctuation characters, built once at
+# import. Case folding stays a separate str.lower() call rather than being
+# folded into the table: a table can only map the 26 ASCII uppercase code
+# points, while lower() handles accented and other non-ASCII letters that
+# real transcripts do contain.
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+
+@functools.lru_cache(maxsize=1 << 16)
 def normalize_word(text: str) -> str:
-    """Converts text to lowercase and removes all punctuation."""
-    text = text.lower()
-    # This removes all punctuation characters
-    return text.translate(str.maketrans('', '', string.punctuation))
+    """
+    Converts text to lowercase and removes all punctuation.
+
+    Memoized: the pipeline calls this once per transcript word per chunk,
+    and real transcripts draw from a small vocabulary, so the hit rate is
+    near-total and repeat tokens cost a dict lookup instead of the
+    lower/translate work.
+
+    Invariant: the result is always interned. Every normalized word in the
+    pipeline therefore shares one object per distinct spelling, and the
+    matcher's sequence comparisons reduce to pointer identity tests instead
+    of character compares. Callers must not bypass this module when
+    producing words that will be compared.
+    """
+    # Most transcript tokens are already clean lowercase words; the three
+    # C-level scans below each bail on the first offending character, so
+    # the common case interns the input itself with no intermediate
+    # allocations (lower() and translate() would each build a new string
+    # even when they change nothing).
+    if text.isascii() and text.islower() and text.isalnum():
+        return sys.intern(text)
+    return sys.intern(text.lower().translate(_PUNCT_TABLE))
+
+
+def normalize_words_batch(words: List[str]) -> List[str]:
+    """
+    Normalizes a whole batch of words in one pass over their combined text.
+
+    Equivalent to `[normalize_word(w) for w in words]`, but the words are
+    joined on NUL — a character that never occurs in transcript text and
+    that neither pass touches — so lower() and translate() each run once
+    over the batch at C level instead of once per word with Python call
+    overhead in between. Callers normalizing entire blocks use this; ad-hoc
+    single words keep the memoized normalize_word. Results are interned,
+    upholding the same invariant as normalize_word.
+    """
+    if not words:
+        return []
+    intern = sys.intern
+    return [intern(text) for text in '\x00'.join(words).lower().translate(_PUNCT_TABLE).split('\x00')]
+
+
+def tokenize_and_normalize(text: str) -> List[str]:
+    """
+    Splits free text on whitespace and normalizes every token in one step.
+
+    Fuses what callers previously did as split + normalize_word per token,
+    routing the whole text through normalize_words_batch's single-pass
+    lower/translate. A regex tokenizer (matching word characters and
+    discarding the rest) was considered and rejected: it would split
+    intra-word punctuation apart ("don't" -> "don", "t") where the
+    pipeline's normalization collapses it ("dont"), and chunk-to-block
+    matching depends on both sides agreeing on that.
+    """
+    return normalize_words_batch(text.split())
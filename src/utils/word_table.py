@@ -0,0 +1,76 @@
+# src/utils/word_table.py
+import logging
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Characters that terminate a sentence, used by the boundary-scan columns.
+_SENTENCE_END = frozenset('.?!')
+
+
+def _ends_sentence(text: str) -> bool:
+    """
+    Returns True if the last non-whitespace character ends a sentence.
+
+    Equivalent to `text.strip().endswith(('.', '?', '!'))` but without the
+    intermediate stripped-string allocation, which matters because this runs
+    once per transcript word.
+    """
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return i >= 0 and text[i] in _SENTENCE_END
+
+
+class WordTable:
+    """
+    Columnar (structure-of-arrays) view over a transcript's word objects.
+
+    Several services scan the same list-of-dicts word layout, paying a dict
+    lookup per attribute per word. This table extracts the scanned attributes
+    into parallel NumPy arrays in a single pass, so downstream boundary scans
+    and filters run as C-level column operations. The original word dicts are
+    kept alongside the columns and are only materialized back into output
+    structures at service boundaries.
+
+    Built on plain NumPy arrays rather than a heavier columnar library so the
+    serverless deployment image stays small.
+    """
+
+    __slots__ = ('words', 'word_positions', 'speaker_codes', 'ends_sentence',
+                 'speaker_change_positions')
+
+    def __init__(self, words: List[Dict]):
+        """
+        Builds the column arrays from a list of word objects.
+
+        Args:
+            words: Transcript items ('word', 'spacing', 'pause') in order.
+        """
+        count = len(words)
+        self.words = words
+        self.speaker_codes = np.full(count, -1, dtype=np.int64)
+        self.ends_sentence = np.zeros(count, dtype=bool)
+
+        speaker_to_code: Dict = {}
+        for i, word_data in enumerate(words):
+            if word_data.get('type') != 'word':
+                continue
+            speaker = word_data.get('speaker_id')
+            self.speaker_codes[i] = speaker_to_code.setdefault(speaker, len(speaker_to_code))
+            self.ends_sentence[i] = _ends_sentence(word_data['text'])
+
+        # Indices of items with type == 'word', in transcript order. Non-word
+        # items keep speaker code -1, so this doubles as the word-type mask.
+        self.word_positions = np.nonzero(self.speaker_codes >= 0)[0]
+
+        # Offsets (into word_positions) where a new speaker run begins. With
+        # these precomputed, "where does the current speaker stop talking?"
+        # becomes a binary search instead of a scan over the transcript tail.
+        word_speakers = self.speaker_codes[self.word_positions]
+        self.speaker_change_positions = np.nonzero(word_speakers[1:] != word_speakers[:-1])[0] + 1
+
+    def __len__(self) -> int:
+        return len(self.words)